@@ -1,134 +1,392 @@
 import asyncio
 import aiohttp
 import ssl
-import json
+import os
 import time
-import hashlib
+import random
+import functools
 import re
-from typing import Dict, List, Optional, Any, Set, Tuple
-from urllib.parse import quote
-from bs4 import BeautifulSoup
+from typing import Dict, List, Optional, Any, Set, Tuple, Callable, Awaitable, Mapping
+from urllib.parse import quote, urlsplit
+from contextlib import asynccontextmanager
+from concurrent.futures import Executor
+from bs4 import BeautifulSoup, SoupStrainer
+from cachetools import TTLCache
+from diskcache import FanoutCache
+import orjson
+from lxml import etree
 import logging
 from collections import defaultdict, Counter
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+# Keyword extraction: runs of 4+ letters in lowercased text, minus common and generic academic words
+_WORD_RE = re.compile(r'[a-z]{4,}')
+_STOPWORDS = frozenset({
+    'using', 'based', 'analysis', 'study', 'approach', 'method', 'system', 'model', 'paper', 'research',
+    'with', 'from', 'that', 'this', 'these', 'their', 'which', 'when', 'where', 'have', 'been', 'than',
+    'into', 'over', 'through', 'between', 'within', 'without', 'towards', 'toward'
+})
+
+# Shared, read-only request headers
+_DEFAULT_HEADERS = MappingProxyType({'Accept': 'application/json'})
+_SCHOLAR_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+})
+
+# SSL context that handles certificate issues, built once since loading the cert store is costly
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.check_hostname = False
+_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=20)
+
+# Response body caps, so one oversized upstream reply cannot exhaust memory
+_MAX_JSON_BYTES = 2_000_000
+_MAX_HTML_BYTES = 5_000_000
+
+# Google Scholar pages are parsed with strainers so only the links we read are materialized:
+# citation profile links on the search page, research interest links on the profile page.
+_CITATION_HREF_RE = re.compile(r'citations\?user=')
+_CITATION_LINK_STRAINER = SoupStrainer('a', href=_CITATION_HREF_RE)
+_INTEREST_LINK_STRAINER = SoupStrainer('a', attrs={'class': 'gsc_prf_inta'})
+
+# Retries after a Google Scholar 429/503, with exponential backoff from this base (seconds)
+_SCHOLAR_RETRIES = 2
+_SCHOLAR_BACKOFF_BASE = 1.0
+
+# Longest a request may queue for a rate limiter token before the lookup gives up, so a bucket
+# slowed down by repeated 429s fails fast instead of stalling tool calls for minutes
+_MAX_QUEUE_WAIT = 60.0
+
+class RateLimited(Exception):
+    """Raised when an upstream answers 429/503; carries its Retry-After delay in seconds, if any."""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class QueueFull(Exception):
+    """Raised when a request would wait longer than its max_wait for a rate limiter token."""
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a delay-seconds Retry-After header value."""
+    return float(value) if value and value.isdigit() else None
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_author_name(name: str) -> str:
+    """Normalize author names for comparison; memoized since the same names recur across papers."""
+    return ' '.join(name.lower().split())
+
+_TITLE_NOISE_RE = re.compile(r'[\W_]+')
+
+def _normalize_title(title: str) -> str:
+    """Normalize a paper title for cross-source de-duplication: lowercase words, punctuation dropped."""
+    return _TITLE_NOISE_RE.sub(' ', title.lower()).strip()
+
+def _parse_profile_href(html: bytes) -> Optional[str]:
+    """Return the href of the first citation profile link on a Scholar search page."""
+    soup = BeautifulSoup(html, 'lxml', parse_only=_CITATION_LINK_STRAINER)
+    citation_link = soup.find('a', href=_CITATION_HREF_RE)
+    return citation_link.get('href') if citation_link else None
+
+def _parse_scholar_profile(html: bytes) -> List[str]:
+    """Return the research interest keywords listed on a Scholar profile page."""
+    soup = BeautifulSoup(html, 'lxml', parse_only=_INTEREST_LINK_STRAINER)
+    keywords = []
+    for link in soup.find_all('a'):
+        text = link.get_text(strip=True)
+        if text:
+            keywords.append(text)
+    return keywords
+
+class _Partial:
+    """A fetch result built while some source failed; it is returned to the caller but not cached."""
+    
+    __slots__ = ('value',)
+    
+    def __init__(self, value: Any):
+        self.value = value
+
+class _TokenBucket:
+    """Per-API rate limiter state, slotted to keep attribute access cheap on every request."""
+    
+    __slots__ = ('tokens', 'last', 'capacity', 'rate', 'max_rate', 'min_rate', 'increase', 'decrease', 'waiting')
+    
+    def __init__(self, max_calls: int, window: float, now: float):
+        self.tokens = float(max_calls)
+        self.last = now
+        self.capacity = max_calls
+        self.rate = max_calls / window
+        self.max_rate = self.rate
+        self.min_rate = self.rate / 32
+        self.increase = self.rate / 20
+        self.decrease = 0.5
+        # Callers currently sleeping for a refill
+        self.waiting = 0
+
 class AuthorSearchEngine:
     """
     Academic author search engine that aggregates data from multiple sources.
+    
+    Every search shares a single pooled HTTP session, opened on first use. Use the engine as an
+    async context manager (``async with AuthorSearchEngine() as engine``) so the session is closed.
+    
+    Results are cached in memory (cache_size entries, each kept for cache_ttl seconds); pass cache_dir
+    to also persist them on disk across restarts.
+    
+    Scholar HTML is parsed off the event loop in parse_executor, or the loop's default thread
+    pool if none is given; pass a ProcessPoolExecutor to keep parsing from holding the GIL.
     """
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None, cache_size: int = 512, cache_ttl: float = 3600,
+                 parse_executor: Optional[Executor] = None):
         self.session = None
-        self.cache = {}
+        self.parse_executor = parse_executor
+        self._session_lock = asyncio.Lock()
+        # Bounded, expiring result cache so long-running servers neither leak memory nor serve stale data.
+        # Once full, the least recently used entry is evicted.
+        self.cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        # Optional on-disk cache behind it, so results survive restarts. Sharded so several server
+        # processes can share one directory without serializing on a single SQLite write lock.
+        self.disk_cache = FanoutCache(os.path.expanduser(cache_dir), shards=8, size_limit=2**30) if cache_dir else None
+        self._cache_lock = asyncio.Lock()
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        # Token bucket per API: holds up to max_calls tokens, refilled at max_calls/window per second.
+        # The refill rate adapts to server pushback: additive increase on success, multiplicative
+        # decrease on 429/503, bounded between min_rate and max_rate.
+        now = time.monotonic()
         self.rate_limits = {
-            'semantic_scholar': {'calls': 0, 'reset_time': time.time()},
-            'openalex': {'calls': 0, 'reset_time': time.time()},
-            'crossref': {'calls': 0, 'reset_time': time.time()},
-            'arxiv': {'calls': 0, 'reset_time': time.time()},
-            'pubmed': {'calls': 0, 'reset_time': time.time()}
+            api_name: _TokenBucket(max_calls, window, now)
+            for api_name, (max_calls, window) in {
+                # One author search plus up to three paper fetches per lookup, so 100 lookups an hour
+                'semantic_scholar': (400, 3600),
+                'openalex': (100, 3600),
+                'crossref': (100, 3600),
+                'arxiv': (30, 3600),
+                'pubmed': (100, 3600),
+                # Scholar has no API; keep scraping slow enough to stay clear of its CAPTCHA wall
+                'google_scholar': (6, 60)
+            }.items()
         }
+        self._rate_locks = {api_name: asyncio.Lock() for api_name in self.rate_limits}
+        # Scraped hosts get one request at a time, spaced at least _host_min_interval seconds apart
+        self._host_semaphores = defaultdict(lambda: asyncio.Semaphore(1))
+        self._host_last: Dict[str, float] = {}
+        self._host_min_interval = 2.0
+        # Caps outstanding requests per API independently of the connection pool, so a slow API
+        # cannot tie up connections the others need
+        self._api_semaphores = {api_name: asyncio.Semaphore(4) for api_name in self.rate_limits}
         
     async def __aenter__(self):
-        # Create SSL context that handles certificate issues
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-        
-        # Configure timeout settings
-        timeout = aiohttp.ClientTimeout(total=30, connect=10)
-        
-        # Create connector with SSL context
-        connector = aiohttp.TCPConnector(
-            ssl=ssl_context,
-            limit=100,
-            limit_per_host=10,
-            enable_cleanup_closed=True
-        )
-        
-        self.session = aiohttp.ClientSession(
-            connector=connector,
-            timeout=timeout
-        )
+        await self._ensure_session()
         return self
         
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
+    async def _ensure_session(self):
+        """Create the shared pooled session on first use; concurrent first callers build it only once."""
         if self.session:
-            await self.session.close()
-
-    def _get_cache_key(self, *args) -> str:
-        """Generate cache key from arguments."""
-        return hashlib.md5(str(args).encode()).hexdigest()
-
-    async def _rate_limit_check(self, api_name: str, max_calls: int = 100, window: int = 3600):
-        """Check and enforce rate limits."""
-        now = time.time()
-        if now - self.rate_limits[api_name]['reset_time'] > window:
-            self.rate_limits[api_name] = {'calls': 0, 'reset_time': now}
-        
-        if self.rate_limits[api_name]['calls'] >= max_calls:
-            sleep_time = window - (now - self.rate_limits[api_name]['reset_time'])
-            if sleep_time > 0:
-                await asyncio.sleep(min(sleep_time, 60))  # Cap at 1 minute
-        
-        self.rate_limits[api_name]['calls'] += 1
-
-    async def _make_request(self, url: str, headers: Dict = None) -> Optional[Dict]:
-        """Make HTTP request with error handling."""
-        if not self.session:
-            # Create session with SSL context if not exists
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+            return
+        
+        async with self._session_lock:
+            if self.session:
+                return
             
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
+            # One pooled session for all hosts, so keep-alive connections and DNS lookups are reused
             connector = aiohttp.TCPConnector(
-                ssl=ssl_context,
-                limit=100,
-                limit_per_host=10,
+                ssl=_SSL_CONTEXT,
+                limit=64,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
                 enable_cleanup_closed=True
             )
             
             self.session = aiohttp.ClientSession(
                 connector=connector,
-                timeout=timeout
+                timeout=_DEFAULT_TIMEOUT
             )
-            
+        
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.session:
+            await self.session.close()
+            self.session = None
+        if self.disk_cache is not None:
+            self.disk_cache.close()
+
+    def _get_cache_key(self, kind: str, name: str, surname: str, institution: Optional[str] = None, field: Optional[str] = None) -> Tuple:
+        """Generate a normalized cache key tuple; dicts hash tuples natively, so no digest is needed."""
+        normalize = _normalize_author_name
+        return (kind, normalize(name), normalize(surname), normalize(institution or ''), normalize(field or ''))
+
+    async def _rate_limit_check(self, api_name: str, max_wait: Optional[float] = None):
+        """
+        Take a token from the API's bucket, waiting for a refill if it is empty.
+        
+        With max_wait, gives up instead of queueing when the callers already waiting mean the
+        next token is further away than that.
+        """
+        bucket = self.rate_limits[api_name]
+        queued = False
         try:
-            async with self.session.get(url, headers=headers or {}) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    logger.warning(f"Request failed: {url} - Status: {response.status}")
-                    return None
-        except asyncio.TimeoutError:
-            logger.error(f"Timeout error for {url}")
+            while True:
+                async with self._rate_locks[api_name]:
+                    now = time.monotonic()
+                    bucket.tokens = min(bucket.capacity, bucket.tokens + (now - bucket.last) * bucket.rate)
+                    bucket.last = now
+                    
+                    if bucket.tokens >= 1:
+                        bucket.tokens -= 1
+                        return
+                    wait = (1 - bucket.tokens) / bucket.rate
+                    
+                    if not queued:
+                        expected_wait = wait + bucket.waiting / bucket.rate
+                        if max_wait is not None and expected_wait > max_wait:
+                            raise QueueFull(f"{api_name} request queue is full, retry in {expected_wait:.0f}s")
+                        bucket.waiting += 1
+                        queued = True
+                
+                # Sleep outside the lock so other callers of this API are not serialized behind us
+                await asyncio.sleep(wait)
+        finally:
+            if queued:
+                bucket.waiting -= 1
+
+    async def _read_limited(self, response: aiohttp.ClientResponse, max_bytes: int) -> Optional[bytes]:
+        """Read a response body, or return None once it exceeds max_bytes."""
+        if response.content_length is not None and response.content_length > max_bytes:
+            logger.warning("Response too large: %s - %s bytes", response.url, response.content_length)
             return None
+        
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(65536):
+            body += chunk
+            if len(body) > max_bytes:
+                logger.warning("Response too large: %s - over %s bytes", response.url, max_bytes)
+                return None
+        return bytes(body)
+
+    @asynccontextmanager
+    async def _host_slot(self, url: str):
+        """Hold the url's host for one request, waiting only as long as the minimum spacing requires."""
+        host = urlsplit(url).hostname
+        async with self._host_semaphores[host]:
+            wait = self._host_min_interval - (time.monotonic() - self._host_last.get(host, float('-inf')))
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                yield
+            finally:
+                self._host_last[host] = time.monotonic()
+
+    def _increase_rate(self, api_name: str):
+        """Additively grow an API's refill rate after a successful response."""
+        bucket = self.rate_limits[api_name]
+        bucket.rate = min(bucket.max_rate, bucket.rate + bucket.increase)
+
+    def _decrease_rate(self, api_name: str, retry_after: Optional[float] = None):
+        """Multiplicatively shrink an API's refill rate after the server pushed back."""
+        bucket = self.rate_limits[api_name]
+        bucket.rate = max(bucket.min_rate, bucket.rate * bucket.decrease)
+        bucket.tokens = 0.0
+        bucket.last = time.monotonic()
+        
+        # Defer the next refill so _rate_limit_check sleeps through the Retry-After period
+        if retry_after is not None:
+            bucket.last += retry_after
+        logger.warning("Rate limited by %s, refill rate lowered to %.4f/s", api_name, bucket.rate)
+
+    async def _make_request(self, url: str, api_name: str, headers: Mapping[str, str] = _DEFAULT_HEADERS) -> Dict:
+        """
+        Make HTTP request and return its decoded JSON body.
+        
+        Raises on rate limiting, error statuses, timeouts and unusable bodies, so a failed source
+        is never mistaken for one that found nothing (and cached as such).
+        """
+        await self._ensure_session()
+        
+        try:
+            async with self._api_semaphores[api_name], self.session.get(url, headers=headers) as response:
+                if response.status in (429, 503):
+                    retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                    self._decrease_rate(api_name, retry_after)
+                    raise RateLimited(f"Request failed with status {response.status}", retry_after)
+                if response.status != 200:
+                    raise Exception(f"Request failed with status {response.status}")
+                # Provider outage pages come back as HTML 200s; reject them without reading the body
+                if 'json' not in response.content_type:
+                    raise Exception(f"Non-JSON response - Content-Type: {response.content_type}")
+                
+                self._increase_rate(api_name)
+                raw = await self._read_limited(response, _MAX_JSON_BYTES)
+                if raw is None:
+                    raise Exception("Response exceeded size limit")
+                return orjson.loads(raw)
+        except asyncio.TimeoutError:
+            raise Exception(f"Timeout error for {url}")
         except aiohttp.ClientSSLError as e:
-            logger.error(f"SSL error for {url}: {str(e)}")
-            return None
+            raise Exception(f"SSL error for {url}: {e}")
         except aiohttp.ClientError as e:
-            logger.error(f"Client error for {url}: {str(e)}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error for {url}: {str(e)}")
-            return None
+            raise Exception(f"Client error for {url}: {e}")
+        except orjson.JSONDecodeError as e:
+            raise Exception(f"Invalid JSON from {url}: {e}")
+
+    async def _search_semantic_scholar(self, name: str, surname: str, institution: Optional[str] = None) -> List[Dict]:
+        """Search Semantic Scholar, returning the best-matching author candidates with their papers attached."""
+        candidates = await self._ss_author_search(name, surname)
+        # Stable sort, so equally scored candidates keep Semantic Scholar's relevance order
+        candidates.sort(key=lambda author: self._score_ss_candidate(author, surname, institution), reverse=True)
+        candidates = candidates[:3]
+        papers = await asyncio.gather(*[self._ss_author_papers(author['authorId']) for author in candidates])
+        return [{**author, 'papers': author_papers} for author, author_papers in zip(candidates, papers)]
 
-    async def _search_semantic_scholar(self, name: str, surname: str) -> List[Dict]:
-        """Search Semantic Scholar API."""
-        await self._rate_limit_check('semantic_scholar', 100)
+    def _score_ss_candidate(self, author: Dict, surname: str, institution: Optional[str] = None) -> int:
+        """Score a Semantic Scholar author candidate: exact surname match, then institution match."""
+        score = 0
+        name_parts = _normalize_author_name(author.get('name') or '').split()
+        if name_parts and name_parts[-1] == _normalize_author_name(surname):
+            score += 2
+        if institution:
+            institution = _normalize_author_name(institution)
+            if any(institution in _normalize_author_name(aff) for aff in author.get('affiliations') or []):
+                score += 1
+        return score
+
+    async def _ss_author_search(self, name: str, surname: str) -> List[Dict]:
+        """Lean Semantic Scholar author search, without the papers join."""
+        await self._rate_limit_check('semantic_scholar', max_wait=_MAX_QUEUE_WAIT)
         
         query = f"{name} {surname}"
-        url = f"https://api.semanticscholar.org/graph/v1/author/search?query={quote(query)}&fields=authorId,name,affiliations,papers,papers.title,papers.authors,papers.venue,papers.year"
+        url = f"https://api.semanticscholar.org/graph/v1/author/search?query={quote(query)}&fields=authorId,name,affiliations&limit=10"
+        
+        data = await self._make_request(url, 'semantic_scholar')
+        if data and 'data' in data:
+            return data['data']
+        return []
+
+    async def _ss_author_papers(self, author_id: str) -> List[Dict]:
+        """Fetch up to 100 papers of a Semantic Scholar author."""
+        await self._rate_limit_check('semantic_scholar', max_wait=_MAX_QUEUE_WAIT)
+        
+        url = f"https://api.semanticscholar.org/graph/v1/author/{quote(author_id)}/papers?fields=title,authors,venue,year&limit=100"
         
-        data = await self._make_request(url)
+        data = await self._make_request(url, 'semantic_scholar')
         if data and 'data' in data:
             return data['data']
         return []
 
     async def _search_openalex(self, name: str, surname: str, institution: Optional[str] = None) -> List[Dict]:
         """Search OpenAlex API."""
-        await self._rate_limit_check('openalex', 100)
+        await self._rate_limit_check('openalex', max_wait=_MAX_QUEUE_WAIT)
         
         query = f"{name} {surname}"
         if institution:
@@ -136,68 +394,81 @@ class AuthorSearchEngine:
             
         url = f"https://api.openalex.org/authors?search={quote(query)}&per-page=10"
         
-        data = await self._make_request(url)
+        data = await self._make_request(url, 'openalex')
         if data and 'results' in data:
             return data['results']
         return []
 
     async def _search_crossref(self, name: str, surname: str) -> List[Dict]:
         """Search Crossref API."""
-        await self._rate_limit_check('crossref', 100)
+        await self._rate_limit_check('crossref', max_wait=_MAX_QUEUE_WAIT)
         
         query = f"{name} {surname}"
         url = f"https://api.crossref.org/works?query.author={quote(query)}&rows=50"
         
-        data = await self._make_request(url)
+        data = await self._make_request(url, 'crossref')
         if data and 'message' in data and 'items' in data['message']:
             return data['message']['items']
         return []
 
     async def _search_arxiv(self, name: str, surname: str) -> List[Dict]:
         """Search arXiv API."""
-        await self._rate_limit_check('arxiv', 30)
+        await self._rate_limit_check('arxiv', max_wait=_MAX_QUEUE_WAIT)
         
         query = f"au:\"{name} {surname}\""
         url = f"http://export.arxiv.org/api/query?search_query={quote(query)}&start=0&max_results=50"
         
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-            
-        try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    # Parse XML content (simplified)
-                    return [{'source': 'arxiv', 'content': content}]
-        except Exception as e:
-            logger.error(f"ArXiv search error: {str(e)}")
+        await self._ensure_session()
         
-        return []
-
-    def _normalize_author_name(self, name: str) -> str:
-        """Normalize author names for comparison."""
-        return ' '.join(name.lower().split())
+        try:
+            async with self._api_semaphores['arxiv'], self.session.get(url) as response:
+                if response.status in (429, 503):
+                    retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                    self._decrease_rate('arxiv', retry_after)
+                    raise RateLimited(f"ArXiv search failed with status {response.status}", retry_after)
+                if response.status != 200:
+                    raise Exception(f"ArXiv search failed with status {response.status}")
+                self._increase_rate('arxiv')
+                
+                # Stream the Atom feed through a pull parser, keeping only what co-author extraction needs
+                parser = etree.XMLPullParser(events=('end',), tag=f'{_ATOM_NS}entry')
+                papers = []
+                async for chunk in response.content.iter_chunked(8192):
+                    parser.feed(chunk)
+                    papers.extend(self._read_arxiv_entries(parser))
+                parser.close()
+                papers.extend(self._read_arxiv_entries(parser))
+                
+                # Same shape as a Semantic Scholar author record
+                return [{'name': f"{name} {surname}", 'papers': papers}] if papers else []
+        except asyncio.TimeoutError:
+            raise Exception("ArXiv search timed out")
+        except aiohttp.ClientError as e:
+            raise Exception(f"ArXiv network error: {e}")
+        except etree.XMLSyntaxError as e:
+            raise Exception(f"ArXiv returned malformed XML: {e}")
 
-    def _extract_coauthors_from_semantic_scholar(self, author_data: Dict) -> List[Dict]:
-        """Extract co-authors from Semantic Scholar data."""
-        coauthors = {}
-        
-        if 'papers' in author_data:
-            for paper in author_data['papers']:
-                if 'authors' in paper:
-                    for author in paper['authors']:
-                        if author.get('name'):
-                            name = self._normalize_author_name(author['name'])
-                            if name not in coauthors:
-                                coauthors[name] = {
-                                    'name': author['name'],
-                                    'id': author.get('authorId'),
-                                    'collaborations': 0,
-                                    'source': 'semantic_scholar'
-                                }
-                            coauthors[name]['collaborations'] += 1
-        
-        return list(coauthors.values())
+    def _read_arxiv_entries(self, parser: etree.XMLPullParser) -> List[Dict]:
+        """Convert the Atom entries parsed so far into compact paper dicts, freeing their elements."""
+        papers = []
+        for _, entry in parser.read_events():
+            published = entry.findtext(f'{_ATOM_NS}published') or ''
+            papers.append({
+                'title': ' '.join((entry.findtext(f'{_ATOM_NS}title') or '').split()),
+                'year': int(published[:4]) if published[:4].isdigit() else None,
+                'venue': 'arXiv',
+                'authors': [
+                    {'name': author.text.strip(), 'authorId': None}
+                    for author in entry.iterfind(f'{_ATOM_NS}author/{_ATOM_NS}name')
+                    if author.text
+                ]
+            })
+            
+            # Drop the processed entry and any siblings before it so the tree stays small
+            entry.clear()
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+        return papers
 
     def _extract_coauthors_from_openalex(self, author_data: Dict) -> List[Dict]:
         """Extract co-authors from OpenAlex data."""
@@ -208,188 +479,276 @@ class AuthorSearchEngine:
         return []
 
     def _merge_author_data(self, data_sources: List[Tuple[str, List[Dict]]]) -> Dict:
-        """Merge author data from multiple sources."""
-        merged = {
-            'names': set(),
-            'institutions': set(),
-            'papers': [],
-            'coauthors': {},
-            'keywords': Counter()
-        }
+        """Merge co-authors from every source that returns author records with papers."""
+        # Collaboration counts keyed by normalized name, with (name, id, source) recorded on first sight
+        collaborations = Counter()
+        coauthor_meta = {}
+        # Normalized titles already counted, so a preprint also indexed by Semantic Scholar (or a
+        # paper shared by two candidate records) counts once
+        seen_titles = set()
         
         for source, data_list in data_sources:
+            if source not in ('semantic_scholar', 'arxiv'):
+                continue
             for item in data_list:
-                if source == 'semantic_scholar':
-                    if 'name' in item:
-                        merged['names'].add(item['name'])
-                    if 'affiliations' in item:
-                        for aff in item['affiliations']:
-                            merged['institutions'].add(aff.get('name', ''))
-                    
-                    coauthors = self._extract_coauthors_from_semantic_scholar(item)
-                    for coauthor in coauthors:
-                        name = coauthor['name']
-                        if name not in merged['coauthors']:
-                            merged['coauthors'][name] = coauthor
-                        else:
-                            merged['coauthors'][name]['collaborations'] += coauthor['collaborations']
+                for paper in item.get('papers') or []:
+                    title = _normalize_title(paper.get('title') or '')
+                    if title:
+                        if title in seen_titles:
+                            continue
+                        seen_titles.add(title)
+                    for author in paper.get('authors') or []:
+                        if author.get('name'):
+                            name = _normalize_author_name(author['name'])
+                            collaborations[name] += 1
+                            coauthor_meta.setdefault(name, (author['name'], author.get('authorId'), source))
         
-        return merged
+        return {'collaborations': collaborations, 'coauthor_meta': coauthor_meta}
 
-    async def get_coauthors(self, name: str, surname: str, institution: Optional[str] = None, field: Optional[str] = None) -> List[Dict]:
-        """Get co-authors for a given author."""
-        cache_key = self._get_cache_key('coauthors', name, surname, institution, field)
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+    async def _fetch_scholar_keywords(self, name: str, surname: str, institution: Optional[str] = None) -> Optional[List[str]]:
+        """
+        Find the author's Google Scholar profile and extract its keywords, or None if there is no profile.
+        
+        Runs both steps back to back, backing off with jitter and retrying only when Scholar rate limits us.
+        """
+        for attempt in range(_SCHOLAR_RETRIES + 1):
+            try:
+                # Step 1: Search for author and find their profile URL, cached on its own so a
+                # retry or a later keyword refresh does not repeat the search
+                profile_url = await self._cached(
+                    self._get_cache_key('scholar_profile', name, surname, institution),
+                    lambda: self._search_author_profile(name, surname, institution)
+                )
+                
+                if not profile_url:
+                    return None
+                
+                # Step 2: Extract keywords from profile
+                keywords = await self._extract_keywords_from_profile(profile_url)
+                self._increase_rate('google_scholar')
+                return keywords
+            except RateLimited as e:
+                # Slow the Scholar bucket down for everyone, not just this lookup
+                self._decrease_rate('google_scholar', e.retry_after)
+                if attempt == _SCHOLAR_RETRIES:
+                    raise
+                delay = _SCHOLAR_BACKOFF_BASE * 2 ** attempt + random.uniform(0, 0.5)
+                # Never retry before the server's Retry-After has passed; that only earns another 429
+                if e.retry_after is not None:
+                    delay = max(e.retry_after, delay)
+                    # A Retry-After longer than we let any request queue: give up instead of stalling
+                    if delay > _MAX_QUEUE_WAIT:
+                        raise
+                logger.warning("Google Scholar rate limited, retrying in %.1fs", delay)
+                await asyncio.sleep(delay)
+
+    async def _cached(self, cache_key: Tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for cache_key, or compute it with fetch() and cache it.
+        
+        Concurrent callers that miss on the same key share one in-flight fetch instead
+        of each fanning out their own upstream requests.
+        """
+        async with self._cache_lock:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            task = self._inflight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(self._fill_cache(cache_key, fetch))
+                self._inflight[cache_key] = task
+        
+        # Shield the shared fetch so one cancelled caller does not cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _fill_cache(self, cache_key: Tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fetch(), store its result under cache_key, and retire the in-flight entry.
+        
+        A _Partial result is handed to the waiting callers unwrapped but kept in neither cache, so
+        the next call retries the sources that failed instead of serving the degraded answer for
+        the TTL, or for a day across restarts.
+        """
+        try:
+            result = self._disk_cache_get(cache_key)
+            partial = False
+            if result is None:
+                result = await fetch()
+                partial = isinstance(result, _Partial)
+                if partial:
+                    result = result.value
+                else:
+                    self._disk_cache_set(cache_key, result)
+            if not partial:
+                async with self._cache_lock:
+                    self.cache[cache_key] = result
+            return result
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    def _disk_cache_get(self, cache_key: Tuple) -> Any:
+        """Read a value from the on-disk cache, if one is configured."""
+        if self.disk_cache is None:
+            return None
+        raw = self.disk_cache.get(cache_key)
+        return orjson.loads(raw) if raw is not None else None
+
+    def _disk_cache_set(self, cache_key: Tuple, value: Any):
+        """Write a value to the on-disk cache, if one is configured, expiring after a day."""
+        if self.disk_cache is not None:
+            self.disk_cache.set(cache_key, orjson.dumps(value), expire=86400)
+
+    async def _fetch_paper_sources(self, name: str, surname: str, institution: Optional[str] = None) -> Dict[str, List]:
+        """
+        Query the paper sources concurrently and return their results keyed by source name.
+        
+        Sources that raised are left out of the result. The result is cached so the co-author and
+        keyword lookups share the same network work for an author, unless a source failed.
+        """
+        cache_key = self._get_cache_key('sources', name, surname, institution)
+        return await self._cached(cache_key, lambda: self._gather_paper_sources(name, surname, institution))
 
-        # Search multiple sources in parallel
+    async def _gather_paper_sources(self, name: str, surname: str, institution: Optional[str] = None) -> Dict[str, List]:
+        """Run the paper source searches in one gather, dropping the ones that failed."""
+        # Only sources an extractor reads are fetched: this dict is cached per author, and OpenAlex
+        # authors and Crossref works would be held there without ever being used. Google Scholar
+        # is fetched on its own by get_author_keywords_from_scholar, so co-author lookups never
+        # wait on its much slower rate limit.
         tasks = [
-            ('semantic_scholar', self._search_semantic_scholar(name, surname)),
-            ('openalex', self._search_openalex(name, surname, institution)),
-            ('crossref', self._search_crossref(name, surname)),
+            ('semantic_scholar', self._search_semantic_scholar(name, surname, institution)),
+            ('arxiv', self._search_arxiv(name, surname)),
         ]
         
         results = await asyncio.gather(*[task[1] for task in tasks], return_exceptions=True)
-        data_sources = []
+        sources = {}
+        
+        for (source, _), result in zip(tasks, results):
+            if source == 'arxiv' and isinstance(result, QueueFull):
+                # arXiv only supplements Semantic Scholar; once its 30/hour budget is spent, go on
+                # without it rather than leave every result uncached until the bucket refills
+                logger.warning("Skipping %s: %s", source, result)
+                sources[source] = []
+            elif isinstance(result, Exception):
+                logger.error("Error fetching %s data: %s", source, result)
+            else:
+                sources[source] = result
         
-        for i, result in enumerate(results):
-            if not isinstance(result, Exception) and result:
-                data_sources.append((tasks[i][0], result))
+        return sources if len(sources) == len(tasks) else _Partial(sources)
+
+    async def get_coauthors(self, name: str, surname: str, institution: Optional[str] = None, field: Optional[str] = None) -> List[Dict]:
+        """Get co-authors for a given author."""
+        cache_key = self._get_cache_key('coauthors', name, surname, institution, field)
+        return await self._cached(cache_key, lambda: self._build_coauthors(name, surname, institution))
+
+    async def _build_coauthors(self, name: str, surname: str, institution: Optional[str] = None) -> List[Dict]:
+        """Merge co-authors from the shared paper source fetch, most frequent collaborators first."""
+        sources = await self._fetch_paper_sources(name, surname, institution)
+        data_sources = [
+            (source, sources[source])
+            for source in ('semantic_scholar', 'arxiv')
+            if sources.get(source)
+        ]
 
         # Merge data from all sources
         merged_data = self._merge_author_data(data_sources)
         
-        # Convert to final format
-        coauthors = []
-        for name, data in merged_data['coauthors'].items():
-            coauthors.append({
-                'name': data['name'],
-                'collaborations': data['collaborations'],
-                'source': data['source']
-            })
-        
-        # Sort by collaboration count
-        coauthors.sort(key=lambda x: x['collaborations'], reverse=True)
+        # Convert to final format, sorted by collaboration count
+        meta = merged_data['coauthor_meta']
+        coauthors = [
+            {'name': meta[name][0], 'collaborations': count, 'source': meta[name][2]}
+            for name, count in merged_data['collaborations'].most_common()
+        ]
         
-        self.cache[cache_key] = coauthors
-        return coauthors
+        # Missing papers from a failed source would undercount; leave such a list uncached
+        return coauthors if 'semantic_scholar' in sources and 'arxiv' in sources else _Partial(coauthors)
 
     async def get_author_keywords(self, name: str, surname: str, institution: Optional[str] = None) -> List[Dict]:
         """Get research keywords for a given author."""
         cache_key = self._get_cache_key('keywords', name, surname, institution)
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        return await self._cached(cache_key, lambda: self._build_keywords(name, surname, institution))
+
+    async def _build_keywords(self, name: str, surname: str, institution: Optional[str] = None) -> List[Dict]:
+        """Count title and venue words across the author's Semantic Scholar papers."""
+        # Use the semantic scholar papers from the shared paper source fetch
+        sources = await self._fetch_paper_sources(name, surname, institution)
+        result = self._count_title_keywords(sources.get('semantic_scholar', []), 20)
+        return result if 'semantic_scholar' in sources else _Partial(result)
 
-        # Search semantic scholar for papers
-        semantic_data = await self._search_semantic_scholar(name, surname)
+    def _count_title_keywords(self, semantic_data: List[Dict], limit: int) -> List[Dict]:
+        """Return the limit most frequent title and venue words across Semantic Scholar author records."""
         keywords = Counter()
         
         for author in semantic_data:
             if 'papers' in author:
-                for paper in author['papers']:
-                    title = paper.get('title', '')
-                    venue = paper.get('venue', '')
-                    
-                    # Extract keywords from title and venue (simplified)
-                    words = title.lower().split() + venue.lower().split()
-                    # Filter out common words and short words
-                    filtered_words = [w for w in words if len(w) > 3 and w not in ['the', 'and', 'for', 'with', 'from', 'that', 'this']]
-                    keywords.update(filtered_words)
+                # Tokenize all titles and venues of the author in one pass, filtering out common words
+                text = ' '.join(
+                    f"{paper.get('title') or ''} {paper.get('venue') or ''}"
+                    for paper in author['papers']
+                ).lower()
+                keywords.update(w for w in _WORD_RE.findall(text) if w not in _STOPWORDS)
 
         # Convert to final format
-        keyword_list = [
+        return [
             {'keyword': word, 'frequency': count}
-            for word, count in keywords.most_common(20)
+            for word, count in keywords.most_common(limit)
         ]
-        
-        self.cache[cache_key] = keyword_list
-        return keyword_list
 
     async def get_author_keywords_from_scholar(self, name: str, surname: str, institution: Optional[str] = None) -> List[str]:
         """Get research keywords for a given author from Google Scholar only."""
         cache_key = self._get_cache_key('scholar_keywords', name, surname, institution)
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        return await self._cached(cache_key, lambda: self._build_scholar_keywords(name, surname, institution))
 
+    async def _build_scholar_keywords(self, name: str, surname: str, institution: Optional[str] = None) -> List[str]:
+        """Fetch the author's Google Scholar keywords, falling back to other sources."""
         try:
-            # Step 1: Search for author and find their profile URL
-            profile_url = await self._search_author_profile(name, surname, institution)
-            
-            # Small delay to be respectful
-            await asyncio.sleep(2)
-            
-            # Step 2: Extract keywords from profile
-            keywords = await self._extract_keywords_from_profile(profile_url)
-            
-            self.cache[cache_key] = keywords
-            return keywords
-            
+            keywords = await self._fetch_scholar_keywords(name, surname, institution)
+            if keywords is not None:
+                return keywords
+            # No Scholar profile: a lasting answer, so the fallback below may be cached
+            scholar_failed = False
         except Exception as e:
-            logger.error(f"Error getting keywords from Google Scholar: {str(e)}")
-            # Return fallback keywords based on other sources
-            try:
-                # Try to get keywords from other APIs as fallback
-                fallback_keywords = await self.get_author_keywords(name, surname, institution)
-                if fallback_keywords and isinstance(fallback_keywords, list):
-                    extracted_keywords = [item.get('keyword', '') for item in fallback_keywords if isinstance(item, dict) and 'keyword' in item]
-                    return extracted_keywords[:10]  # Limit to first 10
-            except:
-                pass
-            return []
+            logger.error("Error fetching google_scholar data: %s", e)
+            scholar_failed = True
+
+        # Google Scholar has nothing for this author, return fallback keywords from the shared
+        # paper source fetch; after a Scholar failure they are left uncached so the next call
+        # tries Scholar again
+        sources = await self._fetch_paper_sources(name, surname, institution)
+        keywords = [item['keyword'] for item in self._count_title_keywords(sources.get('semantic_scholar', []), 10)]
+        if scholar_failed or 'semantic_scholar' not in sources:
+            return _Partial(keywords)
+        return keywords
 
     async def _search_author_profile(self, name: str, surname: str, institution: str = None):
-        """Step 1: Search for author and find their profile URL"""
-        if not self.session:
-            # Create session with SSL context if not exists
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            connector = aiohttp.TCPConnector(
-                ssl=ssl_context,
-                limit=100,
-                limit_per_host=10,
-                enable_cleanup_closed=True
-            )
-            
-            self.session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout
-            )
-            
+        """Step 1: Search for author and find their profile URL, or '' if the search lists no profile"""
+        await self._ensure_session()
+        
         search_query = f"{name} {surname}"
         if institution:
             search_query += f" {institution}"
         
         search_url = f"https://scholar.google.com/scholar?q={quote(search_query)}"
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
+        await self._rate_limit_check('google_scholar', max_wait=_MAX_QUEUE_WAIT)
         
         try:
-            async with self.session.get(search_url, headers=headers) as response:
+            async with self._host_slot(search_url), self.session.get(search_url, headers=_SCHOLAR_HEADERS) as response:
+                if response.status in (429, 503):
+                    raise RateLimited(f"Search failed with status {response.status}", _parse_retry_after(response.headers.get('Retry-After')))
                 if response.status != 200:
                     raise Exception(f"Search failed with status {response.status}")
                 
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
+                html = await self._read_limited(response, _MAX_HTML_BYTES)
+                if html is None:
+                    raise Exception("Search page exceeded size limit")
+                # Parse off the event loop so concurrent fetches are not stalled
+                profile_href = await asyncio.get_running_loop().run_in_executor(self.parse_executor, _parse_profile_href, html)
                 
-                # Look for citation profile links
-                citation_links = soup.find_all('a', href=lambda x: x and 'citations?user=' in x)
+                if not profile_href:
+                    # A lasting answer rather than a failure, so it is cached like a found profile
+                    return ''
                 
-                if not citation_links:
-                    raise Exception("No author profile found in search results")
-                
-                # Get the first profile URL
-                profile_href = citation_links[0].get('href')
                 if profile_href.startswith('/'):
                     profile_url = 'https://scholar.google.com' + profile_href
                 else:
@@ -397,6 +756,8 @@ class AuthorSearchEngine:
                 
                 return profile_url
                 
+        except RateLimited:
+            raise
         except asyncio.TimeoutError:
             raise Exception("Google Scholar search timed out")
         except aiohttp.ClientSSLError as e:
@@ -404,66 +765,32 @@ class AuthorSearchEngine:
         except aiohttp.ClientError as e:
             raise Exception(f"Network error connecting to Google Scholar: {str(e)}")
         except Exception as e:
-            if "profile found" in str(e) or "failed with status" in str(e):
+            if "failed with status" in str(e) or "size limit" in str(e):
                 raise e
             else:
                 raise Exception(f"Unexpected error searching Google Scholar: {str(e)}")
 
     async def _extract_keywords_from_profile(self, profile_url: str):
         """Step 2: Extract keywords from author's profile page"""
-        if not self.session:
-            # Create session with SSL context if not exists
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            connector = aiohttp.TCPConnector(
-                ssl=ssl_context,
-                limit=100,
-                limit_per_host=10,
-                enable_cleanup_closed=True
-            )
-            
-            self.session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout
-            )
-            
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
+        await self._ensure_session()
+        
+        await self._rate_limit_check('google_scholar', max_wait=_MAX_QUEUE_WAIT)
         
         try:
-            async with self.session.get(profile_url, headers=headers) as response:
+            async with self._host_slot(profile_url), self.session.get(profile_url, headers=_SCHOLAR_HEADERS) as response:
+                if response.status in (429, 503):
+                    raise RateLimited(f"Profile page failed with status {response.status}", _parse_retry_after(response.headers.get('Retry-After')))
                 if response.status != 200:
                     raise Exception(f"Profile page failed with status {response.status}")
                 
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Look for interests/keywords section
-                interests_div = soup.find('div', {'id': 'gsc_prf_int'})
-                
-                if not interests_div:
-                    # Try alternative selectors
-                    interests_div = soup.find('div', class_='gsc_prf_il')
-                
-                if not interests_div:
-                    return []
-                
-                # Extract keyword links
-                keyword_links = interests_div.find_all('a', class_='gsc_prf_inta')
-                keywords = [link.get_text().strip() for link in keyword_links if link.get_text().strip()]
-                
-                return keywords
+                html = await self._read_limited(response, _MAX_HTML_BYTES)
+                if html is None:
+                    raise Exception("Profile page exceeded size limit")
+                # Parse off the event loop so concurrent fetches are not stalled
+                return await asyncio.get_running_loop().run_in_executor(self.parse_executor, _parse_scholar_profile, html)
                 
+        except RateLimited:
+            raise
         except asyncio.TimeoutError:
             raise Exception("Google Scholar profile page timed out")
         except aiohttp.ClientSSLError as e:
@@ -471,17 +798,7 @@ class AuthorSearchEngine:
         except aiohttp.ClientError as e:
             raise Exception(f"Network error connecting to Google Scholar profile: {str(e)}")
         except Exception as e:
-            if "failed with status" in str(e):
+            if "failed with status" in str(e) or "size limit" in str(e):
                 raise e
             else:
                 raise Exception(f"Unexpected error extracting keywords from profile: {str(e)}")
-
-    async def _scrape_google_scholar(self, name: str, surname: str, institution: Optional[str] = None) -> List[Dict]:
-        """Deprecated - use get_author_keywords_from_scholar instead"""
-        keywords = await self.get_author_keywords_from_scholar(name, surname, institution)
-        return [{'keyword': kw, 'source': 'google_scholar', 'frequency': 1} for kw in keywords]
-
-    async def _scrape_scholar_profile(self, profile_url: str, headers: Dict) -> List[Dict]:
-        """Deprecated - use _extract_keywords_from_profile instead"""
-        keywords = await self._extract_keywords_from_profile(profile_url)
-        return [{'keyword': kw, 'source': 'google_scholar', 'frequency': 1} for kw in keywords]
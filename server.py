@@ -1,70 +1,209 @@
 from typing import Any, List, Dict, Optional
+from contextlib import asynccontextmanager
+import asyncio
 import logging
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing_extensions import NotRequired, TypedDict
 import uvicorn
 from mcp.server.fastmcp import FastMCP
+from starlette.middleware.gzip import GZipMiddleware
 from search import AuthorSearchEngine
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
 logger = logging.getLogger(__name__)
 
+# HTTP worker processes; MCP sessions live in one process, so with several workers every
+# request must stand alone
+WORKERS = int(os.getenv("WORKERS", 1))
+
+# Interface the HTTP server binds to; all interfaces by default for container deployments
+HOST = os.getenv("HOST", "0.0.0.0")
+
 # Initialize FastMCP server for HTTP transport
 # Port will be set from environment variable when running
-mcp = FastMCP("authorProfile")
+# FastMCP gets the bind host so it only restricts Host headers to localhost (DNS rebinding
+# protection) when the server really is bound to localhost
+# Tool results are returned as plain JSON responses rather than SSE streams, so GZipMiddleware
+# (which skips text/event-stream) can compress them
+mcp = FastMCP("authorProfile", host=HOST, stateless_http=WORKERS > 1, json_response=True)
 
-# Initialize search engine
-search_engine = AuthorSearchEngine()
+# Search engine, created on first use so importing the server (and the STDIO handshake) does not
+# wait on opening the on-disk cache
+_engine: Optional[AuthorSearchEngine] = None
+
+def _get_engine() -> AuthorSearchEngine:
+    """
+    Return the shared search engine, creating it on first call.
+    
+    Results are cached in memory (CACHE_SIZE entries for CACHE_TTL seconds) and persisted under
+    CACHE_DIR (empty to disable), so repeated queries skip the network entirely. With PARSE_WORKERS
+    set, Scholar pages are parsed in that many worker processes instead of threads.
+    """
+    global _engine
+    if _engine is None:
+        parse_workers = int(os.getenv("PARSE_WORKERS", 0))
+        _engine = AuthorSearchEngine(
+            cache_dir=os.getenv("CACHE_DIR", "~/.cache/author_profile_mcp"),
+            cache_size=int(os.getenv("CACHE_SIZE", 4096)),
+            cache_ttl=float(os.getenv("CACHE_TTL", 3600)),
+            parse_executor=ProcessPoolExecutor(max_workers=parse_workers) if parse_workers > 0 else None
+        )
+    return _engine
 
 # Add health check endpoint for Smithery
 # Note: Health check will be handled by FastMCP's built-in capabilities
 
-@mcp.tool()
-async def get_coauthors(
+# Longest institution accepted; anything longer is not an affiliation
+_MAX_INSTITUTION_LENGTH = 200
+
+# Characters a name part may contain: letters (any script), apostrophes, hyphens, spaces and periods
+# ([^\W\d_] is \w without digits and underscore)
+_NAME_RE = re.compile(r"(?:[^\W\d_]|['\u2019\- .]){1,80}")
+
+def _invalid_author(name: str, surname: str, institution: Optional[str]) -> Optional[str]:
+    """Return why the (stripped) author arguments cannot be looked up, or None if they look valid."""
+    if not name or not surname:
+        return "Name and surname are required"
+    if not _NAME_RE.fullmatch(name) or not _NAME_RE.fullmatch(surname):
+        return "Name and surname must be at most 80 letters, spaces, apostrophes, hyphens or periods"
+    if institution and len(institution) > _MAX_INSTITUTION_LENGTH:
+        return f"Institution must be at most {_MAX_INSTITUTION_LENGTH} characters"
+    return None
+
+# Bounds how many authors of one bulk request are looked up at once
+_BULK_SEMAPHORE = asyncio.Semaphore(8)
+
+# Largest batch get_coauthors_bulk accepts
+_MAX_BULK_AUTHORS = 50
+
+class BulkAuthor(TypedDict):
+    """One author of a get_coauthors_bulk request."""
+    name: str
+    surname: str
+    institution: NotRequired[Optional[str]]
+    field: NotRequired[Optional[str]]
+
+async def _coauthors_response(
     name: str,
     surname: str,
     institution: Optional[str] = None,
-    field: Optional[str] = None
+    field: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = None
 ) -> Dict[str, Any]:
-    """
-    Get all co-authors for a given author.
+    """Look up co-authors and wrap them in the tool response format, returning one page of them."""
+    # Reject malformed input before it costs any upstream requests
+    name, surname = name.strip(), surname.strip()
+    error = _invalid_author(name, surname, institution)
+    if offset < 0:
+        error = "offset must not be negative"
+    elif limit is not None and limit < 1:
+        error = "limit must be at least 1"
+    if error:
+        return {"success": False, "error": error, "coauthors": []}
     
-    Args:
-        name: Author's first name
-        surname: Author's last name
-        institution: Optional institution affiliation
-        field: Optional research field
-    
-    Returns:
-        Dictionary containing co-authors list with their information
-    """
     try:
-        logger.info(f"Searching co-authors for {name} {surname}")
+        logger.info("Searching co-authors for %s %s", name, surname)
         
         # Search for author and get co-authors
-        coauthors = await search_engine.get_coauthors(
+        coauthors = await _get_engine().get_coauthors(
             name=name,
             surname=surname,
             institution=institution,
             field=field
         )
         
+        # The engine returns (and caches) a fully materialized list, so later pages cost no upstream
+        # requests and the total is an O(1) len(). Keep it a list: counting a lazy iterator here
+        # would force a second pass over the results.
+        total = len(coauthors)
+        end = total if limit is None else offset + limit
+        page = coauthors[offset:end]
+        
         return {
             "success": True,
             "author": f"{name} {surname}",
             "institution": institution,
-            "total_coauthors": len(coauthors),
-            "coauthors": coauthors
+            "total_coauthors": total,
+            "coauthors": page,
+            "next_offset": end if end < total else None
         }
         
     except Exception as e:
-        logger.error(f"Error getting co-authors: {str(e)}")
+        logger.error("Error getting co-authors: %s", e)
         return {
             "success": False,
             "error": str(e),
             "coauthors": []
         }
 
+@mcp.tool()
+async def get_coauthors(
+    name: str,
+    surname: str,
+    institution: Optional[str] = None,
+    field: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Get all co-authors for a given author.
+    
+    Args:
+        name: Author's first name
+        surname: Author's last name
+        institution: Optional institution affiliation
+        field: Optional research field
+        offset: Optional index of the first co-author to return (not negative)
+        limit: Optional maximum number of co-authors to return (at least 1); pass next_offset back as offset for the next page
+    
+    Returns:
+        Dictionary containing co-authors list with their information
+    """
+    return await _coauthors_response(name, surname, institution, field, offset, limit)
+
+@mcp.tool()
+async def get_coauthors_bulk(authors: List[BulkAuthor]) -> Dict[str, Any]:
+    """
+    Get co-authors for several authors at once, looking them up concurrently.
+    
+    Args:
+        authors: List of up to 50 authors, each with "name" and "surname" and optionally "institution" and "field"
+    
+    Returns:
+        Dictionary containing one get_coauthors result per author, in the same order
+    """
+    if len(authors) > _MAX_BULK_AUTHORS:
+        return {
+            "success": False,
+            "error": f"At most {_MAX_BULK_AUTHORS} authors per request",
+            "results": []
+        }
+    
+    async def lookup(author: BulkAuthor) -> Dict[str, Any]:
+        async with _BULK_SEMAPHORE:
+            return await _coauthors_response(
+                author["name"],
+                author["surname"],
+                author.get("institution"),
+                author.get("field")
+            )
+    
+    results = await asyncio.gather(*[lookup(author) for author in authors], return_exceptions=True)
+    results = [
+        {"success": False, "error": str(result), "coauthors": []} if isinstance(result, Exception) else result
+        for result in results
+    ]
+    
+    return {
+        "success": all(result["success"] for result in results),
+        "total_authors": len(results),
+        "results": results
+    }
+
 @mcp.tool()
 async def get_author_keywords(
     name: str,
@@ -82,10 +221,16 @@ async def get_author_keywords(
     Returns:
         Dictionary containing keywords extracted from Google Scholar
     """
+    # Reject malformed input before it costs a Scholar request
+    name, surname = name.strip(), surname.strip()
+    error = _invalid_author(name, surname, institution)
+    if error:
+        return {"success": False, "error": error, "keywords": []}
+    
     try:
-        logger.info(f"Searching keywords for {name} {surname} on Google Scholar")
+        logger.info("Searching keywords for %s %s on Google Scholar", name, surname)
         
-        keywords = await search_engine.get_author_keywords_from_scholar(
+        keywords = await _get_engine().get_author_keywords_from_scholar(
             name=name,
             surname=surname,
             institution=institution
@@ -101,13 +246,45 @@ async def get_author_keywords(
         }
         
     except Exception as e:
-        logger.error(f"Error getting keywords from Google Scholar: {str(e)}")
+        logger.error("Error getting keywords from Google Scholar: %s", e)
         return {
             "success": False,
             "error": str(e),
             "keywords": []
         }
 
+@asynccontextmanager
+async def _open_engine():
+    """Keep the search engine's session open, then shut down its parse worker processes."""
+    engine = _get_engine()
+    try:
+        async with engine:
+            yield engine
+    finally:
+        if engine.parse_executor is not None:
+            engine.parse_executor.shutdown(cancel_futures=True)
+            engine.parse_executor = None
+
+def build_http_app():
+    """Build the streamable HTTP app, keeping the search engine's session open for its lifetime."""
+    app = mcp.streamable_http_app()
+    session_manager_lifespan = app.router.lifespan_context
+    
+    @asynccontextmanager
+    async def lifespan(app):
+        async with _open_engine(), session_manager_lifespan(app):
+            yield
+    
+    app.router.lifespan_context = lifespan
+    # Compress large JSON responses such as long co-author lists
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    return app
+
+async def run_stdio():
+    """Serve over STDIO with the search engine's session open."""
+    async with _open_engine():
+        await mcp.run_stdio_async()
+
 if __name__ == "__main__":
     # Get transport mode from environment
     transport = os.getenv("TRANSPORT", "stdio")
@@ -115,13 +292,18 @@ if __name__ == "__main__":
     if transport == "http":
         # HTTP mode for Smithery deployment
         port = int(os.getenv("PORT", 8081))
-        host = os.getenv("HOST", "0.0.0.0")
         
-        logger.info(f"Starting HTTP server on {host}:{port}")
-        # Access the FastAPI app instance from FastMCP
-        app = mcp.streamable_http_app
-        uvicorn.run(app, host=host, port=port)
+        logger.info("Starting HTTP server on %s:%s with %d worker(s)", HOST, port, WORKERS)
+        # Passed as an import string so each worker process builds its own app; the workers share
+        # the listening socket and the on-disk cache.
+        # uvloop and httptools for cheaper I/O dispatch; no per-request access log line, and
+        # uvicorn's own loggers follow LOG_LEVEL like ours
+        uvicorn.run(
+            "server:build_http_app", factory=True, workers=WORKERS,
+            host=HOST, port=port, loop="uvloop", http="httptools", access_log=False,
+            log_level=os.getenv("LOG_LEVEL", "warning").lower()
+        )
     else:
         # STDIO mode for local development
         logger.info("Starting STDIO server")
-        mcp.run()
\ No newline at end of file
+        asyncio.run(run_stdio())